@@ -1,17 +1,14 @@
 from importlib import resources
 
 import test.files
-from src.file_reader import read_file
-from src.questionnaire_parser import QuestionnaireParser
+from src.questionnaire_parser import MultipleCorrectAnswersParser
+from src.readers import read_questions
 from src.ui import QuestionnaireUI, MainUI
 
 
 def main():
     with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
-        questionnaire_lines = read_file(path)
-
-    parser = QuestionnaireParser()
-    questions = parser.parse_questionnaire(questionnaire_lines=questionnaire_lines)
+        questions = list(read_questions(path, parser=MultipleCorrectAnswersParser))
 
     ui = MainUI()
     ui.display_questionnaire(questions)
@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from src.dataclasses import Answer, Question
+
+
+class AnswerSelection:
+    def __init__(self, questions: list[Question]):
+        self._selected_answers: dict[Answer, None] = dict()
+        self._selected_answers_by_question: dict[UUID, set[Answer]] = {
+            question.id: set() for question in questions
+        }
+        self._unanswered_question_ids = set(self._selected_answers_by_question)
+
+    @property
+    def selected_answers(self) -> list[Answer]:
+        return list(self._selected_answers)
+
+    @property
+    def has_unanswered_questions(self) -> bool:
+        return bool(self._unanswered_question_ids)
+
+    def is_answered(self, question: Question) -> bool:
+        return question.id not in self._unanswered_question_ids
+
+    def select(self, question: Question, answer: Answer):
+        self._selected_answers[answer] = None
+        self._selected_answers_by_question[question.id].add(answer)
+        self._unanswered_question_ids.discard(question.id)
+
+    def deselect(self, question: Question, answer: Answer):
+        self._selected_answers.pop(answer, None)
+        question_answers = self._selected_answers_by_question[question.id]
+        question_answers.discard(answer)
+        if not question_answers:
+            self._unanswered_question_ids.add(question.id)
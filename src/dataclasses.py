@@ -14,6 +14,7 @@ class Question:
     correct_answers: list[Answer]
     incorrect_answers: list[Answer]
     id: UUID = field(default_factory=uuid4)
+    weight: float = 1.0
 
 
 @dataclass(frozen=True)
@@ -33,3 +34,49 @@ class Score:
     questions_count: int
     correct_questions_count: int
     percentage_correct: float
+    weighted_total: float
+    max_weighted_total: float
+
+
+@dataclass(frozen=True)
+class CompiledQuestion:
+    correct_mask: int
+    incorrect_mask: int
+    weight: float
+
+
+@dataclass(frozen=True)
+class GradingProgress:
+    graded_questions_count: int
+    questions_count: int
+
+
+@dataclass(frozen=True)
+class GradingResult:
+    validated_questions: list[ValidatedQuestion]
+    score: Score
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    name: str
+    allocated_bytes: int
+    peak_bytes: int
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    pipeline: str
+    questions_count: int
+    stages: list[StageMemory]
+    footprint: dict[str, int]
+
+    @property
+    def footprint_bytes(self) -> int:
+        return sum(self.footprint.values())
+
+    @property
+    def bytes_per_million_questions(self) -> float:
+        if self.questions_count == 0:
+            return 0.0
+        return self.footprint_bytes / self.questions_count * 1_000_000
@@ -16,3 +16,27 @@ class NotAQuestionError(Exception):
 
 class NotExactlyOneCorrectAnswerError(Exception):
     pass
+
+
+class NoCorrectAnswerError(Exception):
+    pass
+
+
+class UnsupportedFormatError(Exception):
+    def __init__(self, suffix: str):
+        self.suffix = suffix
+
+
+class MalformedRowError(Exception):
+    def __init__(self, line_number: int):
+        self.line_number = line_number
+
+
+class NonContiguousQuestionError(Exception):
+    def __init__(self, question_text: str):
+        self.question_text = question_text
+
+
+class ConflictingWeightsError(Exception):
+    def __init__(self, question_text: str):
+        self.question_text = question_text
@@ -1,6 +1,37 @@
+import gzip
 from pathlib import Path
+from typing import Iterator, TextIO
+
+GZIP_SUFFIX = ".gz"
 
 
 def read_file(path: Path) -> list[str]:
     content = path.read_text()
     return content.strip().splitlines()
+
+
+def open_text(path: Path) -> TextIO:
+    if path.suffix == GZIP_SUFFIX:
+        return gzip.open(path, mode="rt", newline="")
+    return path.open(newline="")
+
+
+def iter_lines(path: Path) -> Iterator[str]:
+    with open_text(path) as file:
+        previous_line = None
+        pending_blank_lines = []
+        for line in file:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                if previous_line is not None:
+                    pending_blank_lines.append(line)
+                continue
+            if previous_line is None:
+                line = line.lstrip()
+            else:
+                yield previous_line
+                yield from pending_blank_lines
+                pending_blank_lines = []
+            previous_line = line
+        if previous_line is not None:
+            yield previous_line.rstrip()
@@ -0,0 +1,55 @@
+import queue
+import threading
+
+from src.dataclasses import Answer, GradingProgress, GradingResult, Question
+from src.questionnaire_validator import QuestionnaireValidator
+from src.scoring_engine import ScoringEngine, ScoringPolicy, all_or_nothing
+
+PROGRESS_REPORT_STEPS = 100
+
+
+class GradingWorker(threading.Thread):
+    def __init__(
+        self,
+        questions: list[Question],
+        selected_answers: list[Answer],
+        check_answered: bool = True,
+        scoring_policy: ScoringPolicy = all_or_nothing,
+    ):
+        super().__init__(daemon=True)
+        self.questions = questions
+        self.selected_answers = selected_answers
+        self.check_answered = check_answered
+        self.scoring_policy = scoring_policy
+        self.messages = queue.Queue()
+
+    def run(self):
+        try:
+            result = self.grade()
+        except Exception as error:
+            self.messages.put(error)
+        else:
+            self.messages.put(result)
+
+    def grade(self) -> GradingResult:
+        if self.check_answered:
+            QuestionnaireValidator.check_all_questions_are_answered(
+                self.questions, self.selected_answers
+            )
+        engine = ScoringEngine(self.questions, policy=self.scoring_policy)
+        submission = engine.pack_submission(self.selected_answers)
+        return engine.grade_submission(submission, on_progress=self._report_progress)
+
+    def _report_progress(self, graded_questions_count: int):
+        questions_count = len(self.questions)
+        report_interval = max(1, questions_count // PROGRESS_REPORT_STEPS)
+        if (
+            graded_questions_count % report_interval == 0
+            or graded_questions_count == questions_count
+        ):
+            self.messages.put(
+                GradingProgress(
+                    graded_questions_count=graded_questions_count,
+                    questions_count=questions_count,
+                )
+            )
@@ -0,0 +1,130 @@
+import gc
+import sys
+import tracemalloc
+from collections import Counter
+from enum import Enum
+from pathlib import Path
+from types import FunctionType, ModuleType
+from typing import Any, Callable
+
+from src.dataclasses import MemoryReport, StageMemory
+from src.exceptions import UnsupportedFormatError
+from src.file_reader import GZIP_SUFFIX, read_file
+from src.questionnaire_parser import QuestionnaireParser
+from src.readers import get_reader, read_marker_questions, read_questions
+
+Stage = tuple[str, Callable[[Any], Any]]
+
+PIPELINES: dict[str, list[Stage]] = {
+    "lines": [
+        ("read_file", read_file),
+        ("parse_questionnaire", QuestionnaireParser.parse_questionnaire),
+    ],
+    "streaming": [
+        ("read_questions", lambda path: list(read_questions(path))),
+    ],
+}
+
+MARKER_ONLY_PIPELINES = {"lines"}
+
+# Difference between what tracemalloc retained and what the object walk
+# found, e.g. inline instance attributes on Python 3.11+ or allocations not
+# reachable from the result. Negative if the walk counted pre-existing objects.
+UNATTRIBUTED = "unattributed"
+
+_SHARED_TYPES = (type, ModuleType, FunctionType, Enum, bool, type(None))
+
+
+def profile_pipeline(path: Path, pipeline: str = "lines") -> MemoryReport:
+    if not supports_pipeline(path, pipeline):
+        raise UnsupportedFormatError(suffix=path.suffix)
+    return profile_stages(pipeline, PIPELINES[pipeline], path)
+
+
+def supports_pipeline(path: Path, pipeline: str) -> bool:
+    if pipeline not in MARKER_ONLY_PIPELINES:
+        return True
+    is_compressed = path.suffix == GZIP_SUFFIX
+    return not is_compressed and get_reader(path) is read_marker_questions
+
+
+def profile_stages(pipeline: str, stages: list[Stage], path: Path) -> MemoryReport:
+    stage_memories = []
+    result = path
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        for name, stage in stages:
+            tracemalloc.reset_peak()
+            allocated_before, _ = tracemalloc.get_traced_memory()
+            result = stage(result)
+            allocated_after, peak = tracemalloc.get_traced_memory()
+            stage_memories.append(
+                StageMemory(
+                    name=name,
+                    allocated_bytes=allocated_after - allocated_before,
+                    peak_bytes=peak - allocated_before,
+                )
+            )
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    footprint = measure_footprint(result)
+    retained_bytes = sum(stage.allocated_bytes for stage in stage_memories)
+    unattributed_bytes = retained_bytes - sum(footprint.values())
+    if unattributed_bytes:
+        footprint[UNATTRIBUTED] = unattributed_bytes
+    return MemoryReport(
+        pipeline=pipeline,
+        questions_count=len(result),
+        stages=stage_memories,
+        footprint=footprint,
+    )
+
+
+def measure_footprint(root: Any) -> dict[str, int]:
+    footprint = Counter()
+    seen = set()
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        footprint[type(obj).__name__] += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return dict(footprint.most_common())
+
+
+def format_report(report: MemoryReport) -> str:
+    lines = [f"Pipeline '{report.pipeline}': {report.questions_count} questions"]
+    for stage in report.stages:
+        lines.append(
+            f"  {stage.name}: {stage.allocated_bytes} bytes retained, "
+            f"{stage.peak_bytes} bytes peak"
+        )
+    lines.append(f"  footprint: {report.footprint_bytes} bytes")
+    for type_name, size in report.footprint.items():
+        lines.append(f"    {type_name}: {size} bytes")
+    lines.append(f"  per 1M questions: {report.bytes_per_million_questions:.0f} bytes")
+    return "\n".join(lines)
+
+
+def main(arguments: list[str]):
+    path = Path(arguments[0])
+    pipelines = arguments[1:]
+    if not pipelines:
+        for pipeline in PIPELINES:
+            if supports_pipeline(path, pipeline):
+                pipelines.append(pipeline)
+            else:
+                print(
+                    f"Skipping pipeline '{pipeline}': uncompressed marker format only"
+                )
+    for pipeline in pipelines:
+        print(format_report(profile_pipeline(path, pipeline)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,8 +1,11 @@
+from typing import Iterable, Iterator
+
 from src.dataclasses import Question, Answer
 from src.exceptions import (
     NotAnAnswerError,
     NotAQuestionError,
     NotExactlyOneCorrectAnswerError,
+    NoCorrectAnswerError,
 )
 from src import markers, strings
 
@@ -23,6 +26,21 @@ class QuestionnaireParser:
             questions.append(question)
         return questions
 
+    @classmethod
+    def iter_questionnaire(
+        cls, questionnaire_lines: Iterable[str]
+    ) -> Iterator[Question]:
+        question_lines = []
+        for line in questionnaire_lines:
+            if cls._is_question(line) and question_lines:
+                _, question = cls.parse_question(question_lines, 0)
+                yield question
+                question_lines = []
+            question_lines.append(line)
+        if question_lines:
+            _, question = cls.parse_question(question_lines, 0)
+            yield question
+
     @classmethod
     def parse_question(
         cls,
@@ -70,9 +88,12 @@ class QuestionnaireParser:
         current_line_index += 1
         return current_line_index, Answer(text=txt), is_correct_for_current_question
 
-    @staticmethod
+    @classmethod
     def build_question(
-        question_text: str, parsed_answers: list[tuple[Answer, bool]]
+        cls,
+        question_text: str,
+        parsed_answers: list[tuple[Answer, bool]],
+        weight: float = 1.0,
     ) -> Question:
         correct_answers = [
             answer
@@ -85,14 +106,19 @@ class QuestionnaireParser:
             if not is_correct_for_current_question
         ]
         incorrect_answers.append(Answer(text=strings.DONT_KNOW))
-        if len(correct_answers) != 1:
-            raise NotExactlyOneCorrectAnswerError
+        cls.check_correct_answers(correct_answers)
         return Question(
             text=question_text,
             correct_answers=correct_answers,
             incorrect_answers=incorrect_answers,
+            weight=weight,
         )
 
+    @staticmethod
+    def check_correct_answers(correct_answers: list[Answer]):
+        if len(correct_answers) != 1:
+            raise NotExactlyOneCorrectAnswerError
+
     @staticmethod
     def _is_question(txt: str) -> bool:
         return txt.startswith(markers.QUESTION_MARKER)
@@ -100,3 +126,10 @@ class QuestionnaireParser:
     @staticmethod
     def _is_correct(txt: str) -> bool:
         return txt.startswith(markers.CORRECT_ANSWER_MARKER)
+
+
+class MultipleCorrectAnswersParser(QuestionnaireParser):
+    @staticmethod
+    def check_correct_answers(correct_answers: list[Answer]):
+        if not correct_answers:
+            raise NoCorrectAnswerError
@@ -1,4 +1,5 @@
 from itertools import chain
+from typing import Callable, Optional
 
 from src.dataclasses import Question, Answer, AnsweredQuestion, ValidatedQuestion
 from src.exceptions import UnansweredQuestionError
@@ -9,17 +10,19 @@ class QuestionnaireValidator:
     def check_all_questions_are_answered(
         questions: list[Question], selected_answers: list[Answer]
     ):
+        selected_answers = set(selected_answers)
         for question in questions:
             possible_answers = chain(
                 question.correct_answers, question.incorrect_answers
             )
-            select_answers_for_question = set(selected_answers) & set(possible_answers)
-            if len(select_answers_for_question) == 0:
+            if selected_answers.isdisjoint(possible_answers):
                 raise UnansweredQuestionError(unanswered_question=question)
 
     @staticmethod
     def validate_answers(
-        questions: list[Question], user_answers: list[Answer]
+        questions: list[Question],
+        user_answers: list[Answer],
+        on_progress: Optional[Callable[[int], None]] = None,
     ) -> list[ValidatedQuestion]:
         validated_questions = []
         for question in questions:
@@ -27,6 +30,8 @@ class QuestionnaireValidator:
                 question, user_answers
             )
             validated_questions.append(validated_question)
+            if on_progress:
+                on_progress(len(validated_questions))
 
         return validated_questions
 
@@ -0,0 +1,136 @@
+import csv
+import json
+from itertools import groupby
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from src.dataclasses import Answer, Question
+from src.exceptions import (
+    ConflictingWeightsError,
+    MalformedRowError,
+    NonContiguousQuestionError,
+    UnsupportedFormatError,
+)
+from src.file_reader import GZIP_SUFFIX, iter_lines, open_text
+from src.questionnaire_parser import QuestionnaireParser
+
+Reader = Callable[[Path, type[QuestionnaireParser]], Iterator[Question]]
+
+READERS: dict[str, Reader] = {}
+
+CSV_QUESTION_COLUMN = "question"
+CSV_ANSWER_COLUMN = "answer"
+CSV_IS_CORRECT_COLUMN = "is_correct"
+CSV_WEIGHT_COLUMN = "weight"
+CSV_TRUE_VALUES = {"1", "true", "yes", "y", "x"}
+
+
+def register_reader(*suffixes: str) -> Callable[[Reader], Reader]:
+    def decorator(reader: Reader) -> Reader:
+        for suffix in suffixes:
+            READERS[suffix] = reader
+        return reader
+
+    return decorator
+
+
+def get_reader(path: Path) -> Reader:
+    suffix = path.suffix
+    if suffix == GZIP_SUFFIX:
+        suffix = path.with_suffix("").suffix
+    try:
+        return READERS[suffix.lower()]
+    except KeyError:
+        raise UnsupportedFormatError(suffix=suffix)
+
+
+def read_questions(
+    path: Path, parser: type[QuestionnaireParser] = QuestionnaireParser
+) -> Iterator[Question]:
+    reader = get_reader(path)
+    return reader(path, parser)
+
+
+@register_reader("", ".txt")
+def read_marker_questions(
+    path: Path, parser: type[QuestionnaireParser] = QuestionnaireParser
+) -> Iterator[Question]:
+    yield from parser.iter_questionnaire(iter_lines(path))
+
+
+@register_reader(".jsonl")
+def read_jsonl_questions(
+    path: Path, parser: type[QuestionnaireParser] = QuestionnaireParser
+) -> Iterator[Question]:
+    with open_text(path) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            parsed_answers = [
+                (Answer(text=text), True) for text in record["correct_answers"]
+            ] + [(Answer(text=text), False) for text in record["incorrect_answers"]]
+            yield parser.build_question(
+                record["text"],
+                parsed_answers,
+                weight=_read_weight(record.get("weight")),
+            )
+
+
+# All rows of a question must be adjacent, so that questions can be built
+# without holding the whole file in memory.
+@register_reader(".csv")
+def read_csv_questions(
+    path: Path, parser: type[QuestionnaireParser] = QuestionnaireParser
+) -> Iterator[Question]:
+    with open_text(path) as file:
+        rows = _iter_csv_rows(csv.DictReader(file))
+        seen_question_texts = set()
+        for question_text, question_rows in groupby(
+            rows, key=lambda row: row[CSV_QUESTION_COLUMN]
+        ):
+            if question_text in seen_question_texts:
+                raise NonContiguousQuestionError(question_text=question_text)
+            seen_question_texts.add(question_text)
+            question_rows = list(question_rows)
+            parsed_answers = [
+                (
+                    Answer(text=row[CSV_ANSWER_COLUMN]),
+                    _is_true(row[CSV_IS_CORRECT_COLUMN]),
+                )
+                for row in question_rows
+            ]
+            yield parser.build_question(
+                question_text,
+                parsed_answers,
+                weight=_read_question_weight(question_text, question_rows),
+            )
+
+
+def _iter_csv_rows(rows: csv.DictReader) -> Iterator[dict[str, str]]:
+    required_columns = (CSV_QUESTION_COLUMN, CSV_ANSWER_COLUMN, CSV_IS_CORRECT_COLUMN)
+    for row in rows:
+        if any(row.get(column) is None for column in required_columns):
+            raise MalformedRowError(line_number=rows.line_num)
+        yield row
+
+
+def _is_true(value: str) -> bool:
+    return value.strip().lower() in CSV_TRUE_VALUES
+
+
+def _read_question_weight(question_text: str, rows: list[dict[str, str]]) -> float:
+    weights = {
+        _read_weight(row[CSV_WEIGHT_COLUMN])
+        for row in rows
+        if row.get(CSV_WEIGHT_COLUMN)
+    }
+    if len(weights) > 1:
+        raise ConflictingWeightsError(question_text=question_text)
+    return weights.pop() if weights else 1.0
+
+
+def _read_weight(weight: Optional[Union[str, float]]) -> float:
+    if weight is None or weight == "":
+        return 1.0
+    return float(weight)
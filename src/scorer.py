@@ -6,8 +6,14 @@ def collect_statistics(validated_questions: list[ValidatedQuestion]) -> Score:
     correct_questions = [q for q in validated_questions if q.is_correct]
     correct_questions_count = len(correct_questions)
     percentage_correct = len(correct_questions) / len(validated_questions)
+    weighted_total = sum(q.answered_question.question.weight for q in correct_questions)
+    max_weighted_total = sum(
+        q.answered_question.question.weight for q in validated_questions
+    )
     return Score(
         questions_count=questions_count,
         correct_questions_count=correct_questions_count,
         percentage_correct=percentage_correct,
+        weighted_total=weighted_total,
+        max_weighted_total=max_weighted_total,
     )
@@ -0,0 +1,134 @@
+from itertools import chain
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.dataclasses import (
+    Answer,
+    AnsweredQuestion,
+    CompiledQuestion,
+    GradingResult,
+    Question,
+    Score,
+    ValidatedQuestion,
+)
+
+ScoringPolicy = Callable[[CompiledQuestion, int], float]
+
+
+def all_or_nothing(compiled_question: CompiledQuestion, selected_mask: int) -> float:
+    return 1.0 if selected_mask == compiled_question.correct_mask else 0.0
+
+
+def partial_credit(compiled_question: CompiledQuestion, selected_mask: int) -> float:
+    if not compiled_question.correct_mask:
+        return all_or_nothing(compiled_question, selected_mask)
+    hits = (selected_mask & compiled_question.correct_mask).bit_count()
+    misses = (selected_mask & compiled_question.incorrect_mask).bit_count()
+    credit = (hits - misses) / compiled_question.correct_mask.bit_count()
+    return max(credit, 0.0)
+
+
+def compile_question(question: Question) -> CompiledQuestion:
+    correct_count = len(question.correct_answers)
+    incorrect_count = len(question.incorrect_answers)
+    correct_mask = (1 << correct_count) - 1
+    incorrect_mask = ((1 << incorrect_count) - 1) << correct_count
+    return CompiledQuestion(
+        correct_mask=correct_mask,
+        incorrect_mask=incorrect_mask,
+        weight=question.weight,
+    )
+
+
+class ScoringEngine:
+    def __init__(
+        self, questions: list[Question], policy: ScoringPolicy = all_or_nothing
+    ):
+        self.questions = questions
+        self.policy = policy
+        self.compiled_questions = [compile_question(q) for q in questions]
+        self.max_weighted_total = sum(q.weight for q in self.compiled_questions)
+        self._answer_bits: dict[Answer, tuple[int, int]] = {
+            answer: (question_index, 1 << option_index)
+            for question_index, question in enumerate(questions)
+            for option_index, answer in enumerate(
+                chain(question.correct_answers, question.incorrect_answers)
+            )
+        }
+
+    def pack_submission(self, selected_answers: Iterable[Answer]) -> list[int]:
+        submission = [0] * len(self.questions)
+        for answer in selected_answers:
+            try:
+                question_index, bit = self._answer_bits[answer]
+            except KeyError:
+                continue
+            submission[question_index] |= bit
+        return submission
+
+    def grade(self, submission: list[int]) -> list[float]:
+        policy = self.policy
+        return [
+            policy(compiled_question, selected_mask)
+            for compiled_question, selected_mask in zip(
+                self.compiled_questions, submission
+            )
+        ]
+
+    def score(self, submission: list[int]) -> Score:
+        return self._build_score(self.grade(submission))
+
+    def grade_submission(
+        self,
+        submission: list[int],
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> GradingResult:
+        policy = self.policy
+        credits = []
+        validated_questions = []
+        for question, compiled_question, selected_mask in zip(
+            self.questions, self.compiled_questions, submission
+        ):
+            credit = policy(compiled_question, selected_mask)
+            credits.append(credit)
+            user_answers = [
+                answer
+                for option_index, answer in enumerate(
+                    chain(question.correct_answers, question.incorrect_answers)
+                )
+                if selected_mask & (1 << option_index)
+            ]
+            validated_questions.append(
+                ValidatedQuestion(
+                    answered_question=AnsweredQuestion(
+                        question=question, user_answers=user_answers
+                    ),
+                    is_correct=credit == 1.0,
+                )
+            )
+            if on_progress:
+                on_progress(len(validated_questions))
+        return GradingResult(
+            validated_questions=validated_questions, score=self._build_score(credits)
+        )
+
+    def _build_score(self, credits: list[float]) -> Score:
+        questions_count = len(credits)
+        correct_questions_count = sum(1 for credit in credits if credit == 1.0)
+        weighted_total = sum(
+            compiled_question.weight * credit
+            for compiled_question, credit in zip(self.compiled_questions, credits)
+        )
+        percentage_correct = (
+            correct_questions_count / questions_count if questions_count else 0.0
+        )
+        return Score(
+            questions_count=questions_count,
+            correct_questions_count=correct_questions_count,
+            percentage_correct=percentage_correct,
+            weighted_total=weighted_total,
+            max_weighted_total=self.max_weighted_total,
+        )
+
+    def score_many(self, submissions: Iterable[list[int]]) -> Iterator[Score]:
+        for submission in submissions:
+            yield self.score(submission)
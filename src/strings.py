@@ -4,3 +4,4 @@ TITLE = "Questionnaire"
 UNANSWERED_QUESTION_ERROR_TITLE = "Missing answer"
 UNANSWERED_QUESTION_ERROR_MESSAGE = "Some questions were not answered."
 DONT_KNOW = "I am hopeless"
+UNANSWERED = "(unanswered)"
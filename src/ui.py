@@ -1,30 +1,35 @@
+import queue
 import random
 import tkinter as tk
 from functools import partial
 from tkinter import ttk, messagebox
 
 from src import strings
-from src.dataclasses import Question, ValidatedQuestion, Score
-from src.exceptions import UnansweredQuestionError
-from src.questionnaire_validator import QuestionnaireValidator
-from src.scorer import collect_statistics
+from src.answer_selection import AnswerSelection
+from src.dataclasses import GradingProgress, Question, ValidatedQuestion, Score
+from src.grader import GradingWorker
+from src.scoring_engine import ScoringPolicy, all_or_nothing
+
+GRADING_POLL_INTERVAL_MS = 50
 
 
 class MainUI(tk.Tk):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, scoring_policy: ScoringPolicy = all_or_nothing, **kwargs):
         super().__init__(*args, **kwargs)
         self.page = None
+        self.scoring_policy = scoring_policy
 
     def display_questionnaire(self, questions):
         if self.page:
             self.page.destroy()
-        self.page = QuestionnaireUI(questions=questions, master=self)
+        self.page = QuestionnaireUI(
+            questions=questions, scoring_policy=self.scoring_policy, master=self
+        )
         self.page.display_questionnaire()
 
-    def show_results(self, validated_questions: list[ValidatedQuestion]):
+    def show_results(self, validated_questions: list[ValidatedQuestion], score: Score):
         if self.page:
             self.page.destroy()
-        score = collect_statistics(validated_questions)
         self.page = ResultUI(
             validated_questions=validated_questions, score=score, master=self
         )
@@ -67,23 +72,37 @@ class GridUIMixin:
 
 
 class QuestionnaireUI(GridUIMixin, ttk.Frame):
-    def __init__(self, questions: list[Question], master=None):
+    def __init__(
+        self,
+        questions: list[Question],
+        scoring_policy: ScoringPolicy = all_or_nothing,
+        master=None,
+    ):
         super().__init__(master=master)
         self.grid()
         self._root().title(strings.TITLE)  # noqa
         self.questions = questions
+        self.scoring_policy = scoring_policy
         self.answer_selection_map = dict()
+        self.answer_selection = AnswerSelection(questions)
+        self.unanswered_indicators = dict()
+        self.show_results_button = None
+        self.progress_bar = None
+        self.grading_worker = None
 
     def display_questionnaire(self):
         for question in self.questions:
             self._display_question_text(question)
             answers = self._shuffle_answers(question)
             for answer in answers:
-                self._display_answer(answer)
+                self._display_answer(question, answer)
         self._display_buttons()
 
     def _display_question_text(self, question):
         self.add_label(text="\n", column=1)
+        indicator = ttk.Label(master=self, text=strings.UNANSWERED)
+        indicator.grid(column=0, row=self.current_row)
+        self.unanswered_indicators[question.id] = indicator
         self.add_label(text=question.text, column=1)
 
     @staticmethod
@@ -92,32 +111,82 @@ class QuestionnaireUI(GridUIMixin, ttk.Frame):
         random.shuffle(answers)
         return answers
 
-    def _display_answer(self, answer):
+    def _display_answer(self, question, answer):
         self.answer_selection_map[answer] = tk.IntVar()
         self.add_checkbox(
-            text=answer.text, variable=self.answer_selection_map[answer], column=1
+            text=answer.text,
+            variable=self.answer_selection_map[answer],
+            command=partial(self._toggle_answer, question, answer),
+            column=1,
         )
 
+    def _toggle_answer(self, question, answer):
+        if self.answer_selection_map[answer].get():
+            self.answer_selection.select(question, answer)
+        else:
+            self.answer_selection.deselect(question, answer)
+        self._update_unanswered_indicator(question)
+
+    def _update_unanswered_indicator(self, question):
+        is_answered = self.answer_selection.is_answered(question)
+        indicator_text = "" if is_answered else strings.UNANSWERED
+        self.unanswered_indicators[question.id].configure(text=indicator_text)
+
     def _display_buttons(self):
         self.add_label(text="\n")
-        ttk.Button(
+        self.show_results_button = ttk.Button(
             master=self, text=strings.SHOW_RESULTS, command=self.show_results
-        ).grid(column=0, row=self.current_row)
+        )
+        self.show_results_button.grid(column=0, row=self.current_row)
         self.add_button(text=strings.QUIT, command=self.quit, column=2)
 
     def show_results(self):
-        selected_answers = self._collect_selected_answers()
-        try:
-            QuestionnaireValidator.check_all_questions_are_answered(
-                self.questions, selected_answers
-            )
-        except UnansweredQuestionError:
+        if self.answer_selection.has_unanswered_questions:
             self._show_error()
+            return
+        selected_answers = self._collect_selected_answers()
+        self.grading_worker = GradingWorker(
+            self.questions,
+            selected_answers,
+            check_answered=False,
+            scoring_policy=self.scoring_policy,
+        )
+        self._display_progress()
+        self.grading_worker.start()
+        self.after(GRADING_POLL_INTERVAL_MS, self._poll_grading)
+
+    def _display_progress(self):
+        self.show_results_button.state(["disabled"])
+        self.progress_bar = ttk.Progressbar(
+            master=self, mode="determinate", maximum=len(self.questions)
+        )
+        self.progress_bar.grid(column=1, row=self.current_row, sticky="ew")
+
+    def _hide_progress(self):
+        self.progress_bar.destroy()
+        self.progress_bar = None
+        self.show_results_button.state(["!disabled"])
+
+    def _poll_grading(self):
+        while True:
+            try:
+                message = self.grading_worker.messages.get_nowait()
+            except queue.Empty:
+                self.after(GRADING_POLL_INTERVAL_MS, self._poll_grading)
+                return
+            if isinstance(message, GradingProgress):
+                self.progress_bar["value"] = message.graded_questions_count
+            else:
+                self._finish_grading(message)
+                return
+
+    def _finish_grading(self, result):
+        self.grading_worker = None
+        self._hide_progress()
+        if isinstance(result, Exception):
+            raise result
         else:
-            validated_questions = QuestionnaireValidator.validate_answers(
-                self.questions, selected_answers
-            )
-            self.master.show_results(validated_questions)
+            self.master.show_results(result.validated_questions, result.score)
 
     @staticmethod
     def _show_error():
@@ -127,12 +196,7 @@ class QuestionnaireUI(GridUIMixin, ttk.Frame):
         )
 
     def _collect_selected_answers(self):
-        selected_answers = []
-        for answer, selection in self.answer_selection_map.items():
-            is_selected = selection.get()
-            if is_selected:
-                selected_answers.append(answer)
-        return selected_answers
+        return self.answer_selection.selected_answers
 
 
 class ResultUI(GridUIMixin, ttk.Frame):
@@ -186,6 +250,11 @@ class ResultUI(GridUIMixin, ttk.Frame):
             f"questions answered correctly ({self.score.percentage_correct:.0%})"
         )
         self.add_label(text=score_text, column=1)
+        weighted_score_text = (
+            f"Weighted score: {self.score.weighted_total:g} out of "
+            f"{self.score.max_weighted_total:g}"
+        )
+        self.add_label(text=weighted_score_text, column=1)
 
     def _display_buttons(self):
         button_frame = ttk.Frame(master=self)
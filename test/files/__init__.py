@@ -2,3 +2,5 @@ EMPTY = "empty"
 WITH_CONTENT = "with_content"
 WITH_BLANK_LINES = "with_blank_lines"
 WITH_MULTIPLE_QUESTIONS = "with_multiple_questions"
+WITH_MULTIPLE_QUESTIONS_JSONL = "with_multiple_questions.jsonl"
+WITH_MULTIPLE_QUESTIONS_CSV = "with_multiple_questions.csv"
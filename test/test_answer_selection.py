@@ -0,0 +1,57 @@
+from src.answer_selection import AnswerSelection
+from src.dataclasses import Answer, Question
+
+
+def _make_question(text):
+    return Question(
+        text=text,
+        correct_answers=[Answer(text="correct")],
+        incorrect_answers=[Answer(text="incorrect")],
+    )
+
+
+class TestAnswerSelection:
+    def test_all_questions_start_unanswered(self):
+        question = _make_question("How many tests did Malte write")
+
+        selection = AnswerSelection([question])
+
+        assert selection.has_unanswered_questions
+        assert not selection.is_answered(question)
+        assert selection.selected_answers == []
+
+    def test_select_marks_question_as_answered(self):
+        first_question = _make_question("How many tests did Malte write")
+        second_question = _make_question("How many lebkuchen did Fabian eat")
+        selection = AnswerSelection([first_question, second_question])
+
+        selection.select(first_question, first_question.correct_answers[0])
+
+        assert selection.is_answered(first_question)
+        assert not selection.is_answered(second_question)
+        assert selection.has_unanswered_questions
+        assert selection.selected_answers == first_question.correct_answers
+
+    def test_question_stays_answered_while_any_answer_is_selected(self):
+        question = _make_question("Who is working on this kata?")
+        correct_answer = question.correct_answers[0]
+        incorrect_answer = question.incorrect_answers[0]
+        selection = AnswerSelection([question])
+
+        selection.select(question, correct_answer)
+        selection.select(question, incorrect_answer)
+        selection.deselect(question, correct_answer)
+
+        assert not selection.has_unanswered_questions
+        assert selection.selected_answers == [incorrect_answer]
+
+    def test_deselecting_last_answer_marks_question_as_unanswered(self):
+        question = _make_question("What is Maltes current Nemesis?")
+        answer = question.correct_answers[0]
+        selection = AnswerSelection([question])
+
+        selection.select(question, answer)
+        selection.deselect(question, answer)
+
+        assert not selection.is_answered(question)
+        assert selection.selected_answers == []
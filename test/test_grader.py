@@ -0,0 +1,102 @@
+from src.dataclasses import Answer, GradingProgress, GradingResult, Question
+from src.exceptions import UnansweredQuestionError
+from src import grader
+from src.grader import GradingWorker
+from src.scoring_engine import partial_credit
+
+
+def _drain(worker):
+    messages = []
+    while not worker.messages.empty():
+        messages.append(worker.messages.get_nowait())
+    return messages
+
+
+def _make_question(text):
+    return Question(
+        text=text,
+        correct_answers=[Answer(text="correct")],
+        incorrect_answers=[Answer(text="incorrect")],
+    )
+
+
+class TestGradingWorker:
+    def test_hands_off_result(self):
+        question = _make_question("How many tests did Malte write")
+        worker = GradingWorker(
+            questions=[question], selected_answers=question.correct_answers
+        )
+
+        worker.start()
+        worker.join()
+
+        *_, result = _drain(worker)
+        assert isinstance(result, GradingResult)
+        assert result.validated_questions[0].is_correct is True
+        assert result.score.correct_questions_count == 1
+
+    def test_skips_answered_check_if_disabled(self):
+        question = _make_question("How many lebkuchen did Fabian eat")
+        worker = GradingWorker(
+            questions=[question], selected_answers=[], check_answered=False
+        )
+
+        worker.run()
+
+        *_, result = _drain(worker)
+        assert result.score.correct_questions_count == 0
+
+    def test_hands_off_unanswered_question_error(self):
+        question = _make_question("How many lebkuchen did Fabian eat")
+        worker = GradingWorker(questions=[question], selected_answers=[])
+
+        worker.run()
+
+        [error] = _drain(worker)
+        assert isinstance(error, UnansweredQuestionError)
+        assert error.unanswered_question == question
+
+    def test_reports_progress_for_every_question_in_small_banks(self):
+        questions = [_make_question(str(i)) for i in range(3)]
+        selected_answers = [q.incorrect_answers[0] for q in questions]
+        worker = GradingWorker(questions=questions, selected_answers=selected_answers)
+
+        worker.run()
+
+        *progress, result = _drain(worker)
+        assert progress == [
+            GradingProgress(graded_questions_count=count, questions_count=3)
+            for count in (1, 2, 3)
+        ]
+        assert result.score.correct_questions_count == 0
+
+    def test_reports_progress_in_steps(self, monkeypatch):
+        monkeypatch.setattr(grader, "PROGRESS_REPORT_STEPS", 2)
+        questions = [_make_question(str(i)) for i in range(5)]
+        selected_answers = [q.incorrect_answers[0] for q in questions]
+        worker = GradingWorker(questions=questions, selected_answers=selected_answers)
+
+        worker.run()
+
+        *progress, _ = _drain(worker)
+        assert [message.graded_questions_count for message in progress] == [2, 4, 5]
+
+    def test_scores_with_policy(self):
+        question = Question(
+            text="Who is working on this kata?",
+            correct_answers=[Answer(text="Malte"), Answer(text="Fabian")],
+            incorrect_answers=[Answer(text="Matt")],
+            weight=2.0,
+        )
+        worker = GradingWorker(
+            questions=[question],
+            selected_answers=question.correct_answers[:1],
+            scoring_policy=partial_credit,
+        )
+
+        worker.run()
+
+        *_, result = _drain(worker)
+        assert result.validated_questions[0].is_correct is False
+        assert result.score.weighted_total == 1.0
+        assert result.score.max_weighted_total == 2.0
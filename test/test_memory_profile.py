@@ -0,0 +1,168 @@
+import gzip
+import sys
+import tracemalloc
+from importlib import resources
+
+import pytest
+
+import test.files
+from src.dataclasses import Answer, MemoryReport
+from src.exceptions import UnsupportedFormatError
+from src.memory_profile import (
+    PIPELINES,
+    UNATTRIBUTED,
+    format_report,
+    main,
+    measure_footprint,
+    profile_pipeline,
+    profile_stages,
+)
+from src.readers import read_questions
+
+
+def _write_marker_bank(directory, questions_count):
+    directory.mkdir(exist_ok=True)
+    path = directory / "questions.txt"
+    path.write_text(
+        "".join(
+            f"?question{i}\nanswer{i}\n*correct_answer{i}\nother_answer{i}\n"
+            for i in range(questions_count)
+        )
+    )
+    return path
+
+
+class TestMeasureFootprint:
+    def test_breaks_down_by_type(self):
+        answers = [Answer(text="answer")]
+
+        footprint = measure_footprint(answers)
+
+        assert {"list", "Answer", "UUID", "str"} <= set(footprint)
+
+    def test_counts_shared_objects_once(self):
+        answer = Answer(text="answer")
+
+        footprint = measure_footprint([answer, answer])
+
+        assert footprint["Answer"] == measure_footprint([answer])["Answer"]
+
+
+class TestProfilePipeline:
+    @pytest.mark.parametrize("pipeline", list(PIPELINES))
+    def test_reports_every_stage(self, pipeline):
+        with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
+            report = profile_pipeline(path, pipeline)
+
+        assert report.questions_count == 4
+        assert [stage.name for stage in report.stages] == [
+            name for name, _ in PIPELINES[pipeline]
+        ]
+        assert all(stage.peak_bytes >= 0 for stage in report.stages)
+        assert report.footprint["Question"] > 0
+
+    @pytest.mark.parametrize("pipeline", list(PIPELINES))
+    def test_footprint_matches_tracemalloc(self, tmp_path, pipeline):
+        path = _write_marker_bank(tmp_path, questions_count=500)
+        tracemalloc.start()
+        try:
+            allocated_before, _ = tracemalloc.get_traced_memory()
+            questions = list(read_questions(path))
+            allocated_after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        report = profile_pipeline(path, pipeline)
+
+        assert len(questions) == report.questions_count
+        assert report.footprint_bytes == pytest.approx(
+            allocated_after - allocated_before, rel=0.05
+        )
+
+    @pytest.mark.parametrize("pipeline", list(PIPELINES))
+    def test_breakdown_scales_with_question_count(self, tmp_path, pipeline):
+        small_report = profile_pipeline(
+            _write_marker_bank(tmp_path / "small", questions_count=200), pipeline
+        )
+        large_report = profile_pipeline(
+            _write_marker_bank(tmp_path / "large", questions_count=400), pipeline
+        )
+
+        for type_name in ("Question", "Answer", "UUID", "str"):
+            assert large_report.footprint[type_name] == pytest.approx(
+                2 * small_report.footprint[type_name], rel=0.05
+            )
+        answers_per_question = 4
+        assert small_report.footprint["Answer"] == (
+            200 * answers_per_question * sys.getsizeof(Answer(text="answer"))
+        )
+
+    def test_lines_pipeline_rejects_other_formats(self):
+        with resources.path(
+            test.files, test.files.WITH_MULTIPLE_QUESTIONS_JSONL
+        ) as path:
+            with pytest.raises(UnsupportedFormatError):
+                profile_pipeline(path, "lines")
+
+    def test_profiles_custom_representation(self, tmp_path):
+        stages = [("split", lambda path: path.name.split("_"))]
+
+        report = profile_stages("custom", stages, tmp_path / "one_two_three")
+
+        assert report.questions_count == 3
+        assert set(report.footprint) - {UNATTRIBUTED} == {"list", "str"}
+
+
+class TestMemoryReport:
+    def test_bytes_per_million_questions(self):
+        report = MemoryReport(
+            pipeline="lines", questions_count=4, stages=[], footprint={"str": 100}
+        )
+
+        assert report.bytes_per_million_questions == 25_000_000
+
+    def test_no_questions(self):
+        report = MemoryReport(
+            pipeline="lines", questions_count=0, stages=[], footprint={}
+        )
+
+        assert report.bytes_per_million_questions == 0
+
+    def test_format_report_mentions_pipeline(self):
+        report = MemoryReport(
+            pipeline="lines", questions_count=1, stages=[], footprint={"str": 50}
+        )
+
+        assert "Pipeline 'lines'" in format_report(report)
+
+
+class TestMain:
+    def test_default_pipelines_skip_marker_only_for_jsonl(self, capsys):
+        with resources.path(
+            test.files, test.files.WITH_MULTIPLE_QUESTIONS_JSONL
+        ) as path:
+            main([str(path)])
+
+        output = capsys.readouterr().out
+        assert "Skipping pipeline 'lines'" in output
+        assert "Pipeline 'streaming': 4 questions" in output
+
+    def test_default_pipelines_for_marker_format(self, capsys):
+        with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
+            main([str(path)])
+
+        output = capsys.readouterr().out
+        assert "Pipeline 'lines': 4 questions" in output
+        assert "Pipeline 'streaming': 4 questions" in output
+
+    def test_default_pipelines_skip_marker_only_for_gzip(self, tmp_path, capsys):
+        with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
+            content = path.read_bytes()
+        compressed_path = tmp_path / "questions.txt.gz"
+        compressed_path.write_bytes(gzip.compress(content))
+
+        main([str(compressed_path)])
+
+        output = capsys.readouterr().out
+        assert "Skipping pipeline 'lines'" in output
+        assert "Pipeline 'streaming': 4 questions" in output
@@ -5,8 +5,12 @@ from src.exceptions import (
     NotAQuestionError,
     NotAnAnswerError,
     NotExactlyOneCorrectAnswerError,
+    NoCorrectAnswerError,
+)
+from src.questionnaire_parser import (
+    MultipleCorrectAnswersParser,
+    QuestionnaireParser,
 )
-from src.questionnaire_parser import QuestionnaireParser
 
 
 @pytest.fixture
@@ -122,3 +126,29 @@ class TestQuestionnaireParser:
         assert question.incorrect_answers == [
             answer for answer, is_correct in parsed_answers if not is_correct
         ]
+
+
+class TestMultipleCorrectAnswersParser:
+    def test_build_question_accepts_multiple_correct_answers(self):
+        parsed_answers = [
+            (Answer(text="correct_answer"), True),
+            (Answer(text="other_correct_answer"), True),
+            (Answer(text="answer"), False),
+        ]
+
+        question = MultipleCorrectAnswersParser.build_question(
+            "question_text", parsed_answers=parsed_answers, weight=2.0
+        )
+
+        assert len(question.correct_answers) == 2
+        assert question.weight == 2.0
+
+    def test_build_question_errors_if_no_correct_answer(self):
+        parsed_answers = [
+            (Answer(text="answer"), False),
+        ]
+
+        with pytest.raises(NoCorrectAnswerError):
+            MultipleCorrectAnswersParser.build_question(
+                "question_text", parsed_answers=parsed_answers
+            )
@@ -144,3 +144,22 @@ class TestCheckIsAnsweredCorrectly:
         )
 
         assert validated_question.is_correct is False
+
+
+class TestValidateAnswers:
+    def test_reports_progress_per_question(self):
+        questions = [
+            Question(
+                text=text,
+                correct_answers=[Answer(text="0")],
+                incorrect_answers=[Answer(text="1")],
+            )
+            for text in ("first", "second")
+        ]
+        progress = []
+
+        QuestionnaireValidator.validate_answers(
+            questions, user_answers=[], on_progress=progress.append
+        )
+
+        assert progress == [1, 2]
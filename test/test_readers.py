@@ -0,0 +1,228 @@
+import gzip
+from importlib import resources
+
+import pytest
+
+import test.files
+from src.exceptions import (
+    ConflictingWeightsError,
+    MalformedRowError,
+    NonContiguousQuestionError,
+    UnsupportedFormatError,
+)
+from src.file_reader import iter_lines, read_file
+from src.questionnaire_parser import MultipleCorrectAnswersParser
+from src.readers import (
+    get_reader,
+    read_csv_questions,
+    read_jsonl_questions,
+    read_marker_questions,
+    read_questions,
+)
+
+
+def _summarize(questions):
+    return [
+        (
+            question.text,
+            [answer.text for answer in question.correct_answers],
+            [answer.text for answer in question.incorrect_answers],
+        )
+        for question in questions
+    ]
+
+
+@pytest.fixture
+def expected_questions():
+    with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
+        return _summarize(read_questions(path))
+
+
+class TestGetReader:
+    @pytest.mark.parametrize(
+        "file_name, reader",
+        [
+            ("questions", read_marker_questions),
+            ("questions.txt", read_marker_questions),
+            ("questions.gz", read_marker_questions),
+            ("questions.txt.gz", read_marker_questions),
+            ("questions.jsonl", read_jsonl_questions),
+            ("questions.jsonl.gz", read_jsonl_questions),
+            ("questions.CSV", read_csv_questions),
+            ("questions.csv.gz", read_csv_questions),
+        ],
+    )
+    def test_selects_reader_by_suffix(self, tmp_path, file_name, reader):
+        assert get_reader(tmp_path / file_name) is reader
+
+    def test_raises_for_unknown_suffix(self, tmp_path):
+        with pytest.raises(UnsupportedFormatError) as exc:
+            get_reader(tmp_path / "questions.xlsx")
+        assert exc.value.suffix == ".xlsx"
+
+
+class TestReadQuestions:
+    def test_marker_format(self, expected_questions):
+        assert len(expected_questions) == 4
+        assert expected_questions[1] == (
+            "question2",
+            ["correct_answer"],
+            ["answer", "other_answer", "I am hopeless"],
+        )
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            test.files.EMPTY,
+            test.files.WITH_CONTENT,
+            test.files.WITH_BLANK_LINES,
+            test.files.WITH_MULTIPLE_QUESTIONS,
+            test.files.WITH_MULTIPLE_QUESTIONS_JSONL,
+            test.files.WITH_MULTIPLE_QUESTIONS_CSV,
+        ],
+    )
+    def test_iter_lines_matches_read_file(self, file_name):
+        with resources.path(test.files, file_name) as path:
+            assert list(iter_lines(path)) == read_file(path)
+
+    def test_iter_lines_matches_read_file_with_padding(self, tmp_path):
+        path = tmp_path / "questions.txt"
+        path.write_text("\n  ?question1 \n  answer  \n\n  \n*correct_answer  \n\n")
+
+        assert list(iter_lines(path)) == read_file(path)
+        assert _summarize(read_questions(path)) == [
+            (
+                "question1 ",
+                ["correct_answer"],
+                ["  answer  ", "", "  ", "I am hopeless"],
+            )
+        ]
+
+    def test_jsonl_format(self, expected_questions):
+        with resources.path(
+            test.files, test.files.WITH_MULTIPLE_QUESTIONS_JSONL
+        ) as path:
+            assert _summarize(read_questions(path)) == expected_questions
+
+    def test_csv_format(self, expected_questions):
+        with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS_CSV) as path:
+            assert _summarize(read_questions(path)) == expected_questions
+
+    def test_gzip_compressed_marker_format(self, tmp_path, expected_questions):
+        with resources.path(test.files, test.files.WITH_MULTIPLE_QUESTIONS) as path:
+            content = path.read_bytes()
+        compressed_path = tmp_path / "questions.txt.gz"
+        compressed_path.write_bytes(gzip.compress(content))
+
+        assert _summarize(read_questions(compressed_path)) == expected_questions
+
+    def test_reads_lazily(self, tmp_path):
+        path = tmp_path / "questions.txt"
+        path.write_text("?question1\n*correct_answer\n?question2\n")
+
+        questions = read_questions(path)
+
+        assert next(questions).text == "question1"
+
+    def test_skips_surrounding_blank_lines(self, tmp_path):
+        path = tmp_path / "questions.txt"
+        path.write_text("\n\n?question1\n*correct_answer\n\n\n")
+
+        assert _summarize(read_questions(path)) == [
+            ("question1", ["correct_answer"], ["I am hopeless"])
+        ]
+
+    def test_jsonl_weights_and_multiple_correct_answers(self, tmp_path):
+        path = tmp_path / "questions.jsonl"
+        path.write_text(
+            '{"text": "question1", "correct_answers": ["a", "b"], '
+            '"incorrect_answers": ["c"], "weight": 2.5}\n'
+        )
+
+        [question] = read_questions(path, parser=MultipleCorrectAnswersParser)
+
+        assert [answer.text for answer in question.correct_answers] == ["a", "b"]
+        assert question.weight == 2.5
+
+    @pytest.mark.parametrize(
+        "weight_field, weight",
+        [
+            ("", 1.0),
+            (', "weight": null', 1.0),
+            (', "weight": "2"', 2.0),
+            (', "weight": 0', 0.0),
+        ],
+    )
+    def test_jsonl_weight_is_coerced(self, tmp_path, weight_field, weight):
+        path = tmp_path / "questions.jsonl"
+        path.write_text(
+            '{"text": "question1", "correct_answers": ["a"], '
+            f'"incorrect_answers": ["b"]{weight_field}}}\n'
+        )
+
+        [question] = read_questions(path)
+
+        assert question.weight == weight
+        assert isinstance(question.weight, float)
+
+    def test_csv_weight_column(self, tmp_path):
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "question,answer,is_correct,weight\n"
+            "question1,answer,0,3\n"
+            "question1,correct_answer,1,\n"
+        )
+
+        [question] = read_questions(path)
+
+        assert question.weight == 3.0
+
+    def test_csv_weight_on_later_row(self, tmp_path):
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "question,answer,is_correct,weight\n"
+            "question1,answer,0,\n"
+            "question1,correct_answer,1,3\n"
+            "question1,other_answer,0,3.0\n"
+        )
+
+        [question] = read_questions(path)
+
+        assert question.weight == 3.0
+
+    def test_csv_rejects_conflicting_weights(self, tmp_path):
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "question,answer,is_correct,weight\n"
+            "question1,answer,0,2\n"
+            "question1,correct_answer,1,3\n"
+        )
+
+        with pytest.raises(ConflictingWeightsError) as exc:
+            list(read_questions(path))
+        assert exc.value.question_text == "question1"
+
+    def test_csv_rejects_non_contiguous_question(self, tmp_path):
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "question,answer,is_correct\n"
+            "question1,correct_answer,1\n"
+            "question2,correct_answer,1\n"
+            "question1,answer,0\n"
+        )
+
+        with pytest.raises(NonContiguousQuestionError) as exc:
+            list(read_questions(path))
+        assert exc.value.question_text == "question1"
+
+    def test_csv_rejects_short_row(self, tmp_path):
+        path = tmp_path / "questions.csv"
+        path.write_text(
+            "question,answer,is_correct\n"
+            "question1,correct_answer,1\n"
+            "question1,answer\n"
+        )
+
+        with pytest.raises(MalformedRowError) as exc:
+            list(read_questions(path))
+        assert exc.value.line_number == 3
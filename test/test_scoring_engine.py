@@ -0,0 +1,150 @@
+import pytest
+
+from src.dataclasses import Answer, CompiledQuestion, Question
+from src.questionnaire_validator import QuestionnaireValidator
+from src.scorer import collect_statistics
+from src.scoring_engine import (
+    ScoringEngine,
+    all_or_nothing,
+    compile_question,
+    partial_credit,
+)
+
+
+@pytest.fixture
+def multi_select_question():
+    return Question(
+        text="Who is working on this kata?",
+        correct_answers=[Answer(text="Malte"), Answer(text="Fabian")],
+        incorrect_answers=[Answer(text="Matt"), Answer(text="I am hopeless")],
+        weight=2.0,
+    )
+
+
+@pytest.fixture
+def single_select_question():
+    return Question(
+        text="What is Maltes current Nemesis?",
+        correct_answers=[Answer(text="oranges that are hard to peel")],
+        incorrect_answers=[Answer(text="Fabian")],
+    )
+
+
+class TestCompileQuestion:
+    def test_correct_answers_come_first(self, multi_select_question):
+        compiled_question = compile_question(multi_select_question)
+
+        assert compiled_question == CompiledQuestion(
+            correct_mask=0b0011, incorrect_mask=0b1100, weight=2.0
+        )
+
+
+class TestPolicies:
+    @pytest.mark.parametrize(
+        "selected_mask, credit",
+        [(0b0011, 1.0), (0b0001, 0.0), (0b0111, 0.0), (0b0000, 0.0)],
+    )
+    def test_all_or_nothing(self, selected_mask, credit):
+        compiled_question = CompiledQuestion(
+            correct_mask=0b0011, incorrect_mask=0b1100, weight=1.0
+        )
+
+        assert all_or_nothing(compiled_question, selected_mask) == credit
+
+    @pytest.mark.parametrize(
+        "selected_mask, credit",
+        [(0b0011, 1.0), (0b0001, 0.5), (0b0111, 0.5), (0b1101, 0.0), (0b1100, 0.0)],
+    )
+    def test_partial_credit(self, selected_mask, credit):
+        compiled_question = CompiledQuestion(
+            correct_mask=0b0011, incorrect_mask=0b1100, weight=1.0
+        )
+
+        assert partial_credit(compiled_question, selected_mask) == credit
+
+
+class TestScoringEngine:
+    def test_pack_submission_ignores_unknown_answers(self, multi_select_question):
+        engine = ScoringEngine([multi_select_question])
+
+        submission = engine.pack_submission(
+            [multi_select_question.incorrect_answers[0], Answer(text="random")]
+        )
+
+        assert submission == [0b0100]
+
+    def test_all_or_nothing_is_default(
+        self, multi_select_question, single_select_question
+    ):
+        engine = ScoringEngine([multi_select_question, single_select_question])
+        submission = engine.pack_submission(
+            [
+                multi_select_question.correct_answers[0],
+                single_select_question.correct_answers[0],
+            ]
+        )
+
+        score = engine.score(submission)
+
+        assert score.questions_count == 2
+        assert score.correct_questions_count == 1
+        assert score.percentage_correct == 0.5
+        assert score.weighted_total == 1.0
+        assert score.max_weighted_total == 3.0
+
+    def test_partial_credit_is_weighted(
+        self, multi_select_question, single_select_question
+    ):
+        engine = ScoringEngine(
+            [multi_select_question, single_select_question], policy=partial_credit
+        )
+        submission = engine.pack_submission(multi_select_question.correct_answers[:1])
+
+        score = engine.score(submission)
+
+        assert score.correct_questions_count == 0
+        assert score.weighted_total == 1.0
+
+    def test_matches_validator_by_default(
+        self, multi_select_question, single_select_question
+    ):
+        questions = [multi_select_question, single_select_question]
+        selected_answers = multi_select_question.correct_answers + [
+            single_select_question.incorrect_answers[0]
+        ]
+        engine = ScoringEngine(questions)
+
+        score = engine.score(engine.pack_submission(selected_answers))
+
+        validated_questions = QuestionnaireValidator.validate_answers(
+            questions, selected_answers
+        )
+        assert score == collect_statistics(validated_questions)
+
+    def test_grade_submission_matches_validator(
+        self, multi_select_question, single_select_question
+    ):
+        questions = [multi_select_question, single_select_question]
+        selected_answers = multi_select_question.correct_answers + [
+            single_select_question.incorrect_answers[0]
+        ]
+        engine = ScoringEngine(questions)
+        progress = []
+
+        result = engine.grade_submission(
+            engine.pack_submission(selected_answers), on_progress=progress.append
+        )
+
+        validated_questions = QuestionnaireValidator.validate_answers(
+            questions, selected_answers
+        )
+        assert result.validated_questions == validated_questions
+        assert result.score == collect_statistics(validated_questions)
+        assert progress == [1, 2]
+
+    def test_score_many(self, single_select_question):
+        engine = ScoringEngine([single_select_question])
+
+        scores = list(engine.score_many([[0b01], [0b10]]))
+
+        assert [score.correct_questions_count for score in scores] == [1, 0]